@@ -16,13 +16,22 @@ em um único MP3 usando Edge TTS.
 
 # pylint: disable=duplicate-code
 
+import argparse
 import asyncio
+import contextlib
+import cProfile
+import heapq
+import itertools
 import os
+import pstats
 import queue
+import sys
 import tempfile
 import threading
+import time
+import tracemalloc
 from dataclasses import dataclass
-from typing import Dict
+from typing import Callable, Dict
 from tkinter import StringVar, filedialog, messagebox
 
 import customtkinter as ctk
@@ -128,6 +137,203 @@ VOICE_CATALOG = {
 }
 
 
+# ==============================================================
+# Profiling opcional (desligado por padrão)
+# ==============================================================
+
+PROFILE_ENV_VAR = "MATRACA_PROFILE"
+LOOP_LAG_INTERVAL_S = 0.05
+PROFILE_TOP_ALLOCATIONS = 15
+PROFILE_TOP_FUNCTIONS = 25
+# Alocações do próprio profiler não interessam no resumo.
+PROFILE_IGNORED_ALLOCATIONS = (
+    tracemalloc.__file__,
+    cProfile.__file__,
+    pstats.__file__,
+    "<frozen importlib._bootstrap>",
+)
+
+_profile_dir: str | None = None
+
+
+def configure_profiling(target: str | None) -> str | None:
+    """Ativa ou desativa o profiling por job.
+
+    ``target`` vazio, "0", "off" etc. desliga; "1"/"on" grava em uma pasta
+    no diretório temporário; qualquer outro valor é usado como diretório.
+    Retorna o diretório em uso (ou None se desligado). Se o diretório não
+    puder ser criado, emite um aviso e mantém o profiling desligado: um
+    diagnóstico opcional nunca deve impedir o app de abrir.
+    """
+    global _profile_dir  # pylint: disable=global-statement
+
+    value = (target or "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        _profile_dir = None
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        value = os.path.join(tempfile.gettempdir(), "matraca_profiles")
+    try:
+        os.makedirs(value, exist_ok=True)
+    except OSError as e:
+        print(f"Aviso: profiling desativado ({value}): {e}", file=sys.stderr)
+        _profile_dir = None
+        return None
+    _profile_dir = value
+    return value
+
+
+class JobProfiler:
+    """Coleta cProfile, tracemalloc e atraso do event loop de um único job.
+
+    Deve ser iniciado e parado no mesmo thread que executa o job, pois o
+    cProfile só observa o thread em que foi habilitado.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, job_name: str, output_dir: str):
+        self.job_name = job_name
+        self.output_dir = output_dir
+        self.stage_times: Dict[str, float] = {}
+        self.stage_calls: Dict[str, int] = {}
+        self.loop_lags: list[float] = []
+        self.ui_drain_times: list[float] = []
+        self._profile = cProfile.Profile()
+        self._started_at = 0.0
+        self._owns_tracemalloc = False
+        self._peak_before_pause = 0
+        self._paused_at: float | None = None
+        self._paused_total = 0.0
+
+    def start(self) -> None:
+        """Liga tracemalloc e cProfile."""
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._started_at = time.perf_counter()
+        self._profile.enable()
+
+    def pause(self) -> None:
+        """Suspende a coleta enquanto outro job preempta este no mesmo thread."""
+        self._profile.disable()
+        self._peak_before_pause = max(self._peak_before_pause, tracemalloc.get_traced_memory()[1])
+        self._paused_at = time.perf_counter()
+
+    def resume(self) -> None:
+        """Retoma a coleta após :meth:`pause`."""
+        if self._paused_at is not None:
+            self._paused_total += time.perf_counter() - self._paused_at
+            self._paused_at = None
+        # O pico anterior à pausa já está em _peak_before_pause; descarta o
+        # pico do job que preemptou este.
+        tracemalloc.reset_peak()
+        self._profile.enable()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Acumula o tempo de parede gasto em uma etapa do pipeline."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_times[name] = self.stage_times.get(name, 0.0) + time.perf_counter() - t0
+            self.stage_calls[name] = self.stage_calls.get(name, 0) + 1
+
+    @contextlib.asynccontextmanager
+    async def watch_event_loop(self, interval: float = LOOP_LAG_INTERVAL_S):
+        """Mede travamentos do event loop enquanto o bloco estiver ativo."""
+
+        async def _monitor():
+            loop = asyncio.get_running_loop()
+            while True:
+                t0 = loop.time()
+                paused_total = self._paused_total
+                await asyncio.sleep(interval)
+                # Amostras que cruzam uma pausa pertencem ao job que preemptou.
+                if self._paused_at is None and self._paused_total == paused_total:
+                    self.loop_lags.append(max(0.0, loop.time() - t0 - interval))
+
+        task = asyncio.create_task(_monitor())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def record_ui_drain(self, seconds: float) -> None:
+        """Registra a duração de um ciclo de atualização da UI (thread do Tk)."""
+        self.ui_drain_times.append(seconds)
+
+    def stop(self) -> str:
+        """Desliga a coleta, grava os arquivos e retorna o caminho do resumo."""
+        self._profile.disable()
+        elapsed = time.perf_counter() - self._started_at - self._paused_total
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, self._peak_before_pause)
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, pattern) for pattern in PROFILE_IGNORED_ALLOCATIONS]
+        )
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.output_dir, f"{self.job_name}_{stamp}_{os.getpid()}")
+        prof_path = f"{base}.prof"
+        summary_path = f"{base}.txt"
+        self._profile.dump_stats(prof_path)
+
+        lines = [
+            f"Job: {self.job_name}",
+            f"Tempo total: {elapsed:.3f} s",
+            f"Memória (tracemalloc): pico {peak / 1024 / 1024:.2f} MiB, "
+            f"final {current / 1024 / 1024:.2f} MiB",
+            "",
+            "Etapas:",
+        ]
+        for name, total in sorted(self.stage_times.items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {name}: {total:.3f} s em {self.stage_calls[name]} chamada(s)")
+        if self.loop_lags:
+            lines.append(
+                f"Atraso do event loop: máx {max(self.loop_lags) * 1000:.1f} ms, "
+                f"médio {sum(self.loop_lags) / len(self.loop_lags) * 1000:.1f} ms "
+                f"({len(self.loop_lags)} amostras)"
+            )
+        if self.ui_drain_times:
+            lines.append(
+                f"Atualizações da UI: máx {max(self.ui_drain_times) * 1000:.1f} ms "
+                f"({len(self.ui_drain_times)} ciclos)"
+            )
+        lines += ["", "Maiores alocações:"]
+        for stat in snapshot.statistics("lineno")[:PROFILE_TOP_ALLOCATIONS]:
+            lines.append(f"  {stat}")
+        lines += ["", f"cProfile completo: {prof_path}", ""]
+
+        with open(summary_path, "w", encoding="utf-8") as out:
+            out.write("\n".join(lines))
+            stats = pstats.Stats(self._profile, stream=out)
+            stats.sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        return summary_path
+
+
+def start_job_profiler(job_name: str) -> JobProfiler | None:
+    """Inicia um profiler para o job, ou retorna None se o profiling estiver desligado."""
+    if _profile_dir is None:
+        return None
+    profiler = JobProfiler(job_name, _profile_dir)
+    profiler.start()
+    return profiler
+
+
+def profile_stage(profiler: JobProfiler | None, name: str):
+    """Context manager de etapa; sem custo quando não há profiler."""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name)
+
+
 # ==============================================================
 # Utilitários de texto e MP3
 # ==============================================================
@@ -199,7 +405,11 @@ def _strip_id3v1_trailer(data: bytes) -> bytes:
     return data
 
 
-def concatenate_mp3_safely(mp3_paths: list[str], output_path: str) -> None:
+def concatenate_mp3_safely(
+    mp3_paths: list[str],
+    output_path: str,
+    profiler: JobProfiler | None = None,
+) -> None:
     # pylint: disable=too-many-branches
     """Concatena MP3 de forma robusta.
 
@@ -225,13 +435,14 @@ def concatenate_mp3_safely(mp3_paths: list[str], output_path: str) -> None:
     try:
         with open(tmp_out, "wb") as out:
             for idx, p in enumerate(mp3_paths):
-                with open(p, "rb") as f:
+                with profile_stage(profiler, "concat_read"), open(p, "rb") as f:
                     data = f.read()
                 if not data:
                     raise ValueError(f"Bloco de áudio vazio: {p}")
                 data = _strip_id3v2_header(data) if idx > 0 else data
                 data = _strip_id3v1_trailer(data)
-                out.write(data)
+                with profile_stage(profiler, "concat_write"):
+                    out.write(data)
 
         # Validação mínima (evita arquivo final vazio)
         if os.path.getsize(tmp_out) <= 0:
@@ -246,6 +457,256 @@ def concatenate_mp3_safely(mp3_paths: list[str], output_path: str) -> None:
             pass
 
 
+# ==============================================================
+# Motor de síntese (event loop persistente + fila de jobs)
+# ==============================================================
+
+JOB_KIND_GENERATE = "generate"
+JOB_KIND_PREVIEW = "preview"
+JOB_PRIORITIES = {
+    JOB_KIND_PREVIEW: 0,
+    JOB_KIND_GENERATE: 10,
+}
+
+ENGINE_ERRORS = (
+    EdgeTTSException,
+    WebSocketError,
+    SkewAdjustmentError,
+    OSError,
+    RuntimeError,
+    ValueError,
+)
+
+
+@dataclass(frozen=True)
+class SynthesisJob:
+    """Pedido de síntese enfileirado no motor."""
+
+    job_id: int
+    kind: str
+    chunks: tuple[str, ...]
+    voice_id: str
+    settings: EdgeAudioSettings
+    save_path: str | None = None
+
+    @property
+    def priority(self) -> int:
+        """Menor valor = executa antes."""
+        return JOB_PRIORITIES[self.kind]
+
+    @property
+    def tag(self) -> str:
+        """Prefixo usado nas mensagens de status do job."""
+        return f"[Job #{self.job_id}]"
+
+
+class SynthesisEngine:
+    """Motor de síntese de longa duração com um único event loop em background.
+
+    Os jobs rodam um por vez, em ordem de prioridade e depois de chegada.
+    Uma renderização longa cede a vez entre blocos para prévias que chegarem
+    no meio dela. Eventos de UI são entregues via ``notify(event, payload)``,
+    chamado a partir do thread do motor; exceto "status" (texto), o payload
+    é ``job_id`` ("job_active") ou ``(job_id, valor)``.
+    """
+
+    def __init__(self, notify: Callable[[str, object], None]):
+        self._notify = notify
+        self._loop = asyncio.new_event_loop()
+        self._heap: list[tuple[int, int, SynthesisJob]] = []
+        self._wakeup = asyncio.Event()
+        self._job_ids = itertools.count(1)
+        self.active_profiler: JobProfiler | None = None
+        self._serve_task = self._loop.create_task(self._serve())
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="SynthesisEngine",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        kind: str,
+        chunks: list[str],
+        voice_id: str,
+        settings: EdgeAudioSettings,
+        save_path: str | None = None,
+    ) -> SynthesisJob:
+        """Enfileira um job (thread-safe) e o retorna imediatamente."""
+        if kind not in JOB_PRIORITIES:
+            raise ValueError(f"Tipo de job desconhecido: {kind}")
+        if kind == JOB_KIND_GENERATE and save_path is None:
+            raise ValueError("Job de geração sem caminho de saída")
+        job = SynthesisJob(
+            job_id=next(self._job_ids),
+            kind=kind,
+            chunks=tuple(chunks),
+            voice_id=voice_id,
+            settings=settings,
+            save_path=save_path,
+        )
+        self._loop.call_soon_threadsafe(self._push, job)
+        return job
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Cancela o job em andamento, descarta os pendentes e encerra o loop.
+
+        Aguarda até ``timeout`` segundos para o job cancelado liberar seus
+        recursos (ex.: diretório temporário dos blocos).
+        """
+        if not self._thread.is_alive():
+            return
+        with contextlib.suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self._serve_task.cancel)
+        self._thread.join(timeout)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._serve_task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    def _push(self, job: SynthesisJob):
+        heapq.heappush(self._heap, (job.priority, job.job_id, job))
+        self._wakeup.set()
+
+    async def _serve(self):
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            _, _, job = heapq.heappop(self._heap)
+            await self._run_job(job)
+
+    async def _yield_to_higher_priority(self, current: SynthesisJob):
+        """Executa, antes de continuar, jobs mais prioritários que chegaram."""
+        preempted = False
+        while self._heap and self._heap[0][0] < current.priority:
+            _, _, job = heapq.heappop(self._heap)
+            preempted = True
+            outer = self.active_profiler
+            if outer is not None:
+                outer.pause()
+            try:
+                await self._run_job(job)
+            finally:
+                self.active_profiler = outer
+                if outer is not None:
+                    outer.resume()
+        if preempted:
+            self._notify("job_active", current.job_id)
+
+    async def _run_job(self, job: SynthesisJob):
+        """Executa um job e sempre envia exatamente um evento terminal."""
+        # pylint: disable=broad-exception-caught
+        profiler: JobProfiler | None = None
+        what = "prévia" if job.kind == JOB_KIND_PREVIEW else "áudio"
+        try:
+            self._notify("job_active", job.job_id)
+            try:
+                profiler = start_job_profiler(f"{job.kind}_{job.job_id:04d}")
+            except Exception as e:
+                self._notify("status", f"{job.tag} Profiling desativado para este job: {e!r}")
+            self.active_profiler = profiler
+            if job.kind == JOB_KIND_PREVIEW:
+                event, value = await self._run_preview(job, profiler)
+            else:
+                event, value = await self._run_generate(job, profiler)
+        except ENGINE_ERRORS as e:
+            event, value = "error", f"{job.tag} Falha ao gerar {what}: {e}"
+        except Exception as e:
+            # O loop é compartilhado por todos os jobs: um erro inesperado
+            # não pode derrubar o motor.
+            event, value = "error", f"{job.tag} Erro inesperado ao gerar {what}: {e!r}"
+        finally:
+            self.active_profiler = None
+            if profiler is not None:
+                try:
+                    summary_path = profiler.stop()
+                except Exception as e:
+                    self._notify("status", f"{job.tag} Falha ao salvar o perfil do job: {e!r}")
+                else:
+                    self._notify("status", f"{job.tag} Perfil do job salvo em: {summary_path}")
+        self._notify(event, (job.job_id, value))
+
+    async def _run_generate(
+        self,
+        job: SynthesisJob,
+        profiler: JobProfiler | None,
+    ) -> tuple[str, object]:
+        """Gera MP3 temporários por chunk e concatena em um único arquivo."""
+        async with contextlib.AsyncExitStack() as stack:
+            if profiler is not None:
+                await stack.enter_async_context(profiler.watch_event_loop())
+            tmpdir = stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="edge_tts_chunks_")
+            )
+            temp_mp3s: list[str] = []
+            total = len(job.chunks)
+
+            for idx, chunk in enumerate(job.chunks, start=1):
+                await self._yield_to_higher_priority(job)
+                self._notify("status", f"{job.tag} Convertendo bloco {idx}/{total}…")
+                temp_path = os.path.join(tmpdir, f"chunk_{idx:04d}.mp3")
+
+                communicate = edge_tts.Communicate(
+                    chunk,
+                    job.voice_id,
+                    rate=job.settings.rate,
+                    volume=job.settings.volume,
+                    pitch=job.settings.pitch,
+                )
+                with profile_stage(profiler, "synthesize_chunk"):
+                    await communicate.save(temp_path)
+                temp_mp3s.append(temp_path)
+
+                self._notify("progress", (job.job_id, idx / total))
+
+            self._notify("status", f"{job.tag} Concatenando blocos em um único MP3…")
+            with profile_stage(profiler, "concatenate"):
+                concatenate_mp3_safely(temp_mp3s, job.save_path, profiler)
+            self._notify("status", f"{job.tag} Concluído.")
+        return ("done", job.save_path)
+
+    async def _run_preview(
+        self,
+        job: SynthesisJob,
+        profiler: JobProfiler | None,
+    ) -> tuple[str, object]:
+        """Sintetiza a prévia e abre no player padrão."""
+        self._notify("status", f"{job.tag} Gerando prévia…")
+        self._notify("progress", (job.job_id, 0.0))
+        communicate = edge_tts.Communicate(
+            job.chunks[0],
+            job.voice_id,
+            rate=job.settings.rate,
+            volume=job.settings.volume,
+            pitch=job.settings.pitch,
+        )
+        fd, path = tempfile.mkstemp(prefix="gomezztts_preview_", suffix=".mp3")
+        os.close(fd)
+        if profiler is None:
+            await communicate.save(path)
+        else:
+            async with profiler.watch_event_loop():
+                with profiler.stage("synthesize_preview"):
+                    await communicate.save(path)
+
+        self._notify("status", f"{job.tag} Prévia gerada. Abrindo no player padrão…")
+        self._notify("progress", (job.job_id, 1.0))
+        try:
+            os.startfile(path)  # type: ignore[attr-defined]
+        except (OSError, AttributeError):
+            self._notify("status", f"{job.tag} Prévia gerada em: {path}")
+        return ("preview_done", path)
+
+
 # ==============================================================
 # Aplicativo
 # ==============================================================
@@ -264,8 +725,11 @@ class GeradorTTS(ctk.CTk):
         self.minsize(880, 620)
 
         self._ui_queue: queue.Queue[tuple[str, object]] = queue.Queue()
-        self._worker_thread: threading.Thread | None = None
-        self._is_running = False
+        self._engine = SynthesisEngine(self._queue_ui)
+        self._pending_jobs = 0
+        self._active_job_id: int | None = None
+        self._job_progress: Dict[int, float] = {}
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._voice_label_to_id: Dict[str, str] = {}
 
@@ -472,50 +936,88 @@ class GeradorTTS(ctk.CTk):
     def _on_volume_change(self, v: float):
         self._volume_value.set(f"{int(round(float(v)))}%")
 
-    def _set_running_state(self, running: bool):
-        self._is_running = running
-        state = "disabled" if running else "normal"
-        self.btn_generate.configure(state=state)
-        self.btn_preview.configure(state=state)
-        self.combo_language.configure(state=state)
-        self.combo_voice.configure(state=state)
-        self.slider_pitch.configure(state=state)
-        self.slider_rate.configure(state=state)
-        self.slider_volume.configure(state=state)
-        if not running:
+    def _on_job_submitted(self, job: SynthesisJob):
+        self._pending_jobs += 1
+        kind = "prévia" if job.kind == JOB_KIND_PREVIEW else "renderização"
+        self.status.configure(
+            text=f"{job.tag} {kind} na fila ({self._pending_jobs} job(s) pendente(s))."
+        )
+
+    def _on_job_progress(self, job_id: int, fraction: float):
+        self._job_progress[job_id] = fraction
+        if job_id == self._active_job_id:
+            self.progress.set(fraction)
+
+    def _on_job_active(self, job_id: int):
+        self._active_job_id = job_id
+        self.progress.set(self._job_progress.get(job_id, 0.0))
+
+    def _on_job_finished(self, job_id: int):
+        self._job_progress.pop(job_id, None)
+        self._pending_jobs = max(0, self._pending_jobs - 1)
+        if self._pending_jobs:
+            self.status.configure(text=f"{self._pending_jobs} job(s) pendente(s).")
+        else:
+            self._active_job_id = None
             self.progress.set(0.0)
 
+    def _on_close(self):
+        if self._pending_jobs and not messagebox.askyesno(
+            "Sair",
+            f"Há {self._pending_jobs} job(s) pendente(s) que serão cancelados. Sair mesmo assim?",
+        ):
+            return
+        self._engine.shutdown()
+        self.destroy()
+
     def _queue_ui(self, event: str, payload: object):
         """Enfileira atualizações para o thread principal."""
         self._ui_queue.put((event, payload))
 
     def _drain_ui_queue(self):
-        """Processa eventos de UI enfileirados pelo worker."""
+        """Processa eventos de UI enfileirados pelo worker.
+
+        Diálogos são agendados com ``after`` para não bloquear o dreno: com
+        jobs na fila, o próximo job continua atualizando status e progresso.
+        """
+        profiler = self._engine.active_profiler
+        t0 = time.perf_counter() if profiler is not None else 0.0
         try:
             while True:
                 event, payload = self._ui_queue.get_nowait()
                 if event == "progress":
-                    self.progress.set(float(payload))
+                    job_id, fraction = payload
+                    self._on_job_progress(job_id, float(fraction))
+                elif event == "job_active":
+                    self._on_job_active(int(payload))
                 elif event == "status":
                     self.status.configure(text=str(payload))
                 elif event == "done":
-                    self._set_running_state(False)
-                    messagebox.showinfo("Sucesso", f"Áudio MP3 gerado com sucesso:\n{payload}")
+                    job_id, save_path = payload
+                    self._on_job_finished(job_id)
+                    self.after(
+                        0,
+                        messagebox.showinfo,
+                        "Sucesso",
+                        f"Áudio MP3 gerado com sucesso:\n{save_path}",
+                    )
                 elif event == "preview_done":
-                    self._set_running_state(False)
+                    job_id, _ = payload
+                    self._on_job_finished(job_id)
                 elif event == "error":
-                    self._set_running_state(False)
-                    messagebox.showerror("Erro", str(payload))
+                    job_id, message = payload
+                    self._on_job_finished(job_id)
+                    self.after(0, messagebox.showerror, "Erro", str(message))
         except queue.Empty:
             pass
         finally:
+            if profiler is not None:
+                self.update_idletasks()
+                profiler.record_ui_drain(time.perf_counter() - t0)
             self.after(100, self._drain_ui_queue)
 
     def on_click_generate(self):
-        """Valida entrada e inicia a geração do MP3 em background."""
-        if self._is_running:
-            return
-
+        """Valida entrada e enfileira a geração do MP3 no motor."""
         text = self.txt_input.get("1.0", "end-1c")
         if not text.strip():
             messagebox.showwarning("Aviso", "O texto está vazio.")
@@ -549,78 +1051,17 @@ class GeradorTTS(ctk.CTk):
             messagebox.showwarning("Aviso", "Nenhum conteúdo válido para converter.")
             return
 
-        self._set_running_state(True)
-        msg = f"Iniciando… {len(chunks)} bloco(s) de até {MAX_CHUNK_CHARS} caracteres."
-        self._queue_ui("status", msg)
-        self._queue_ui("progress", 0.0)
-
-        # Executa em thread para não travar a UI
-        self._worker_thread = threading.Thread(
-            target=self._run_worker,
-            args=(chunks, voice_id, save_path, settings),
-            daemon=True,
+        job = self._engine.submit(
+            JOB_KIND_GENERATE,
+            chunks,
+            voice_id,
+            settings,
+            save_path=save_path,
         )
-        self._worker_thread.start()
-
-    def _run_worker(
-        self,
-        chunks: list[str],
-        voice_id: str,
-        save_path: str,
-        settings: EdgeAudioSettings,
-    ):
-        """Worker: executa síntese (asyncio) fora da UI."""
-        try:
-            asyncio.run(self._async_generate_mp3(chunks, voice_id, save_path, settings))
-            self._queue_ui("done", save_path)
-        except (
-            EdgeTTSException,
-            WebSocketError,
-            SkewAdjustmentError,
-            OSError,
-            RuntimeError,
-            ValueError,
-        ) as e:
-            self._queue_ui("error", f"Falha ao gerar áudio: {e}")
-
-    async def _async_generate_mp3(
-        self,
-        chunks: list[str],
-        voice_id: str,
-        save_path: str,
-        settings: EdgeAudioSettings,
-    ):
-        """Gera MP3 temporários por chunk e concatena em um único arquivo."""
-        # Gera MP3 temporários por bloco e depois concatena
-        with tempfile.TemporaryDirectory(prefix="edge_tts_chunks_") as tmpdir:
-            temp_mp3s: list[str] = []
-            total = len(chunks)
-
-            for idx, chunk in enumerate(chunks, start=1):
-                self._queue_ui("status", f"Convertendo bloco {idx}/{total}…")
-                temp_path = os.path.join(tmpdir, f"chunk_{idx:04d}.mp3")
-
-                communicate = edge_tts.Communicate(
-                    chunk,
-                    voice_id,
-                    rate=settings.rate,
-                    volume=settings.volume,
-                    pitch=settings.pitch,
-                )
-                await communicate.save(temp_path)
-                temp_mp3s.append(temp_path)
-
-                self._queue_ui("progress", idx / total)
-
-            self._queue_ui("status", "Concatenando blocos em um único MP3…")
-            concatenate_mp3_safely(temp_mp3s, save_path)
-            self._queue_ui("status", "Concluído.")
+        self._on_job_submitted(job)
 
     def on_preview(self):
-        """Gera uma prévia curta e abre no player padrão do Windows."""
-        if self._is_running:
-            return
-
+        """Enfileira uma prévia curta (prioritária) para abrir no player padrão."""
         full_text = self.txt_input.get("1.0", "end-1c").strip()
         if not full_text:
             messagebox.showwarning("Aviso", "O texto está vazio.")
@@ -640,51 +1081,27 @@ class GeradorTTS(ctk.CTk):
 
         settings = self._get_audio_settings()
 
-        self._set_running_state(True)
-        self._queue_ui("status", "Gerando prévia…")
-        self._queue_ui("progress", 0.0)
+        job = self._engine.submit(JOB_KIND_PREVIEW, chunks[:1], voice_id, settings)
+        self._on_job_submitted(job)
 
-        threading.Thread(
-            target=self._preview_worker,
-            args=(chunks[0], voice_id, settings),
-            daemon=True,
-        ).start()
 
-    def _preview_worker(self, text_chunk: str, voice_id: str, settings: EdgeAudioSettings):
-        """Worker: sintetiza a prévia e abre no player."""
-        try:
-            async def _run() -> str:
-                communicate = edge_tts.Communicate(
-                    text_chunk,
-                    voice_id,
-                    rate=settings.rate,
-                    volume=settings.volume,
-                    pitch=settings.pitch,
-                )
-                fd, path = tempfile.mkstemp(prefix="gomezztts_preview_", suffix=".mp3")
-                os.close(fd)
-                await communicate.save(path)
-                return path
-
-            path = asyncio.run(_run())
-            self._queue_ui("status", "Prévia gerada. Abrindo no player padrão…")
-            self._queue_ui("progress", 1.0)
-            try:
-                os.startfile(path)  # type: ignore[attr-defined]
-            except OSError:
-                self._queue_ui("status", f"Prévia gerada em: {path}")
-            self._queue_ui("preview_done", None)
-        except (
-            EdgeTTSException,
-            WebSocketError,
-            SkewAdjustmentError,
-            OSError,
-            RuntimeError,
-            ValueError,
-        ) as e:
-            self._queue_ui("error", f"Falha ao gerar prévia: {e}")
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="MatracaTTS - Gerador de Áudios Longos")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="1",
+        default=os.environ.get(PROFILE_ENV_VAR),
+        metavar="DIR",
+        help=(
+            "Grava cProfile, pico de memória e atraso do event loop por job "
+            f"(padrão: variável {PROFILE_ENV_VAR}; sem DIR usa a pasta temporária)."
+        ),
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
+    configure_profiling(_parse_args().profile)
     app = GeradorTTS()
     app.mainloop()